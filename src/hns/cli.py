@@ -29,16 +29,17 @@ import json
 import sys
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
 
 from . import fs
-from .sanitizer_menu import launch_sanitizer_menu
+
+# Rich and the sanitizer menu are imported on first use inside the menus, so a
+# one-shot `hns PATH --hide` never pays their import cost.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
 
 # --------------------------------------------------------------------------- #
 # Typer app set-up
@@ -49,7 +50,7 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console(highlight=False)
+console: Optional[Console] = None  # created by _console() on first use
 ON = "●"
 OFF = "○"
 
@@ -78,11 +79,12 @@ class Config:
         return cls()
 
     def save(self) -> None:
-        CONFIG_FILE.write_text(json.dumps(asdict(self), indent=2))
+        CONFIG_FILE.write_text(json.dumps(asdict(self), separators=(",", ":")))
 
 
 cfg = Config.load()
 
+
 # --------------------------------------------------------------------------- #
 # CLI – non-interactive one-shot mode
 # --------------------------------------------------------------------------- #
@@ -137,20 +139,45 @@ def _entrypoint(
 # --------------------------------------------------------------------------- #
 
 
+def _console() -> Console:
+    global console
+    if console is None:
+        from rich.console import Console
+
+        console = Console(highlight=False)
+    return console
+
+
+def _set_cell(table: Table, row: int, text: str) -> None:
+    """Overwrite one cell of a menu's second column in place."""
+    table.columns[1]._cells[row] = text
+
+
 def _interactive_menu() -> None:
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    from .sanitizer_menu import launch_sanitizer_menu
+
+    console = _console()
+    # Static menu – built once; the screen is only repainted when `dirty`
+    table = Table(show_header=False)
+    table.add_row("[1]", "Hide")
+    table.add_row("[2]", "Seek")
+    table.add_row("[3]", "Config")
+    table.add_row("[4]", "File Sanitizer")
+    table.add_row("[h]", "Help")
+    table.add_row("[q]", "Quit")
+    dirty = True
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold cyan]Welcome to Hide N' Seek Directory Manager[/]"))
-        table = Table(show_header=False)
-        table.add_row("[1]", "Hide")
-        table.add_row("[2]", "Seek")
-        table.add_row("[3]", "Config")
-        table.add_row("[4]", "File Sanitizer")
-        table.add_row("[h]", "Help")
-        table.add_row("[q]", "Quit")
-        console.print(table)
+        if dirty:
+            console.clear()
+            console.print(Panel.fit("[bold cyan]Welcome to Hide N' Seek Directory Manager[/]"))
+            console.print(table)
 
         choice = Prompt.ask("> ").strip().lower()
+        dirty = True  # every valid choice leaves another screen behind
         if choice == "1":
             _hide_menu()
         elif choice == "2":
@@ -165,6 +192,8 @@ def _interactive_menu() -> None:
             input()
         elif choice == "q":
             sys.exit(0)
+        else:
+            dirty = False  # unknown key – nothing changed, skip the repaint
 
 
 def _hide_menu() -> None:
@@ -184,22 +213,30 @@ def _seek_menu() -> None:
 
 
 def _operation_menu(title: str, op: str, cfg_recursive) -> None:
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    console = _console()
     local_recursive = cfg_recursive()
     local_dry_run = cfg.dry_run
+    table = Table(show_header=False)
+    table.add_row("[1]", f"[{ON if local_recursive else OFF}] Recursive {op.capitalize()}")
+    table.add_row("[2]", f"[{ON if local_dry_run else OFF}] Dry Run")
+    table.add_row("[3]", "Config")
+    table.add_row("[h]", "Help")
+    table.add_row("[q]", "Back: Main Menu")
+    dirty = True
     while True:
-        console.clear()
-        console.print(Panel.fit(f"[bold green]{title}[/]"))
-        default_note = f"(default: {cfg.default_path})" if cfg.default_path else ""
-        console.print(f"Press [bold]Enter[/] to provide a folder path {default_note}")
-        table = Table(show_header=False)
-        table.add_row("[1]", f"[{ON if local_recursive else OFF}] Recursive {op.capitalize()}")
-        table.add_row("[2]", f"[{ON if local_dry_run else OFF}] Dry Run")
-        table.add_row("[3]", "Config")
-        table.add_row("[h]", "Help")
-        table.add_row("[q]", "Back: Main Menu")
-        console.print(table)
+        if dirty:
+            console.clear()
+            console.print(Panel.fit(f"[bold green]{title}[/]"))
+            default_note = f"(default: {cfg.default_path})" if cfg.default_path else ""
+            console.print(f"Press [bold]Enter[/] to provide a folder path {default_note}")
+            console.print(table)
 
         choice = Prompt.ask("> ").strip().lower()
+        dirty = True
         if choice == "":
             path = Prompt.ask("Folder path", default=cfg.default_path or "").strip()
             if not path:
@@ -213,8 +250,10 @@ def _operation_menu(title: str, op: str, cfg_recursive) -> None:
             input("Press Enter to continue…")
         elif choice == "1":
             local_recursive = not local_recursive
+            _set_cell(table, 0, f"[{ON if local_recursive else OFF}] Recursive {op.capitalize()}")
         elif choice == "2":
             local_dry_run = not local_dry_run
+            _set_cell(table, 1, f"[{ON if local_dry_run else OFF}] Dry Run")
         elif choice == "3":
             _config_menu()
         elif choice == "h":
@@ -222,50 +261,75 @@ def _operation_menu(title: str, op: str, cfg_recursive) -> None:
             input("Press Enter to continue…")
         elif choice == "q":
             break
+        else:
+            dirty = False
 
 
 def _config_menu() -> None:
-    while True:
-        console.clear()
-        console.print(Panel.fit("[bold magenta]Config Menu - Edit Settings[/]"))
-        table = Table(show_header=False)
-        table.add_row("[1]", f"Set Path → [bold]{cfg.default_path or 'None'}[/]")
-        table.add_row("[2]", "Revert Last Change")
-        table.add_row(
-            "[3]", f"[{ON if cfg.recursive_global_seek else OFF}] Recursive Seek  [Global]"
-        )
-        table.add_row(
-            "[4]", f"[{ON if cfg.recursive_global_hide else OFF}] Recursive Hide  [Global]"
-        )
-        table.add_row("[5]", f"[{ON if cfg.dry_run else OFF}] Dry Run")
-        table.add_row("[q]", "Back: Main Menu")
-        console.print(table)
-
-        choice = Prompt.ask("> ").strip().lower()
-        if choice == "1":
-            new_path = Prompt.ask(
-                "Default folder path (blank to clear)", default=cfg.default_path or ""
-            ).strip()
-            cfg.default_path = new_path or None
-            cfg.save()
-        elif choice == "2":
-            try:
-                fs.revert_last_change(dry_run=cfg.dry_run)
-                console.print("[green]✔ Last change reverted.[/]")
-            except Exception as exc:
-                console.print(f"[red]Error:[/] {exc}")
-            input("Press Enter to continue…")
-        elif choice == "3":
-            cfg.recursive_global_seek = not cfg.recursive_global_seek
-            cfg.save()
-        elif choice == "4":
-            cfg.recursive_global_hide = not cfg.recursive_global_hide
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    console = _console()
+    table = Table(show_header=False)
+    table.add_row("[1]", f"Set Path → [bold]{cfg.default_path or 'None'}[/]")
+    table.add_row("[2]", "Revert Last Change")
+    table.add_row("[3]", f"[{ON if cfg.recursive_global_seek else OFF}] Recursive Seek  [Global]")
+    table.add_row("[4]", f"[{ON if cfg.recursive_global_hide else OFF}] Recursive Hide  [Global]")
+    table.add_row("[5]", f"[{ON if cfg.dry_run else OFF}] Dry Run")
+    table.add_row("[q]", "Back: Main Menu")
+    dirty = True
+    changed = False  # toggles are written once, when the menu closes
+    try:
+        while True:
+            if dirty:
+                console.clear()
+                console.print(Panel.fit("[bold magenta]Config Menu - Edit Settings[/]"))
+                console.print(table)
+
+            choice = Prompt.ask("> ").strip().lower()
+            dirty = True
+            if choice == "1":
+                new_path = Prompt.ask(
+                    "Default folder path (blank to clear)", default=cfg.default_path or ""
+                ).strip()
+                cfg.default_path = new_path or None
+                changed = True
+                _set_cell(table, 0, f"Set Path → [bold]{cfg.default_path or 'None'}[/]")
+            elif choice == "2":
+                try:
+                    fs.revert_last_change(dry_run=cfg.dry_run)
+                    console.print("[green]✔ Last change reverted.[/]")
+                except Exception as exc:
+                    console.print(f"[red]Error:[/] {exc}")
+                input("Press Enter to continue…")
+            elif choice == "3":
+                cfg.recursive_global_seek = not cfg.recursive_global_seek
+                changed = True
+                _set_cell(
+                    table,
+                    2,
+                    f"[{ON if cfg.recursive_global_seek else OFF}] Recursive Seek  [Global]",
+                )
+            elif choice == "4":
+                cfg.recursive_global_hide = not cfg.recursive_global_hide
+                changed = True
+                _set_cell(
+                    table,
+                    3,
+                    f"[{ON if cfg.recursive_global_hide else OFF}] Recursive Hide  [Global]",
+                )
+            elif choice == "5":
+                cfg.dry_run = not cfg.dry_run
+                changed = True
+                _set_cell(table, 4, f"[{ON if cfg.dry_run else OFF}] Dry Run")
+            elif choice == "q":
+                break
+            else:
+                dirty = False
+    finally:
+        if changed:
             cfg.save()
-        elif choice == "5":
-            cfg.dry_run = not cfg.dry_run
-            cfg.save()
-        elif choice == "q":
-            break
 
 
 # --------------------------------------------------------------------------- #
@@ -3,7 +3,7 @@ hns/fs.py
 ─────────
 Core filesystem helpers for Hide N’ Seek Directory Manager.
 
-✓ macOS: uses   chflags (hidden / nohidden)
+✓ macOS: sets   UF_HIDDEN via os.chflags   (what `chflags hidden` does)
 ✓ Linux: renames folder → dot-prefixed   (.foo)   and back              [simple, portable]
 ✓ Windows: uses  attrib  +h /-h  with  /s /d  for recursion
 
@@ -13,7 +13,7 @@ Features
 • seek(path, recursive=False, dry_run=False)  – reveal the folder
 • revert_last_change()                        – undo the most recent hide/seek
 • is_hidden(path)                             – best-effort check
-• History log:  ~/.hns_history.json           – stores every action
+• History log:  ~/.hns_history.jsonl          – one JSON line per action
 
 Exceptions are raised on failure so the CLI can surface them nicely.
 """
@@ -23,19 +23,39 @@ from __future__ import annotations
 import json
 import os
 import platform
-import subprocess
+import stat
 import sys
 import time
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:  # optional C encoder (`pip install hide-n-seek[fast]`), same compact output
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 # --------------------------------------------------------------------------- #
 # Constants & helpers
 # --------------------------------------------------------------------------- #
 
 SYSTEM = platform.system()  # 'Darwin', 'Linux', 'Windows'
-HISTORY_FILE = Path.home() / ".hns_history.json"
+# Index into the back-end tables below; resolved once instead of per call
+_OS = {"Darwin": 0, "Linux": 1, "Windows": 2}.get(SYSTEM, -1)
+HISTORY_FILE = Path.home() / ".hns_history.jsonl"
+_TAIL_CHUNK = 4096  # bytes read per step when scanning history backwards
+_PARALLEL_MIN = 64  # below this many sub-folders a thread pool costs more than it saves
+_FILE_ATTRIBUTE_HIDDEN = 0x2  # Windows
+_INVALID_FILE_ATTRIBUTES = -1  # GetFileAttributesW error, as seen through ctypes
 
 
 @dataclass
@@ -46,13 +66,16 @@ class Action:
     path: str
     op: str  # 'hide' or 'seek'
     recursive: bool
+    # Linux only: every (src, dst) rename actually performed, in order
+    renames: List[Tuple[str, str]] = field(default_factory=list)
 
     def inverse(self) -> "Action":
         return Action(
             timestamp=time.time(),
-            path=self.path,
+            path=self.renames[-1][1] if self.renames else self.path,
             op="seek" if self.op == "hide" else "hide",
             recursive=self.recursive,
+            renames=[(dst, src) for src, dst in reversed(self.renames)],
         )
 
 
@@ -61,21 +84,59 @@ class Action:
 # --------------------------------------------------------------------------- #
 
 
-def _load_history() -> List[Dict[str, Any]]:
-    if HISTORY_FILE.exists():
-        with HISTORY_FILE.open("r", encoding="utf-8") as fp:
-            return json.load(fp)
-    return []
-
+def _history_reversed(path: Path) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """
+    Yield `(start, end, entry)` for every line of the history log at *path*,
+    newest first. Shared by fs.py and sanitizer.py.
 
-def _save_history(entries: List[Dict[str, Any]]) -> None:
-    HISTORY_FILE.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+    The file is read backwards in `_TAIL_CHUNK` steps, so finding a recent
+    entry never parses (or even reads) the older part of the log. Only each
+    new chunk is searched for a newline and a line's chunks are joined once,
+    so a multi-megabyte sanitize entry costs linear time, not quadratic.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as fp:
+        pos = line_end = fp.seek(0, os.SEEK_END)
+        parts: List[bytes] = []  # file[pos:…] of the current line, last part first
+        while pos > 0:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            fp.seek(pos)
+            chunk = fp.read(step)
+            cut = len(chunk)
+            newline = chunk.rfind(b"\n", 0, cut)
+            while newline != -1:
+                parts.append(chunk[newline + 1 : cut])
+                line = b"".join(reversed(parts))
+                start = pos + newline + 1
+                if line.strip():
+                    yield start, line_end, json.loads(line)
+                parts, line_end, cut = [], start, newline
+                newline = chunk.rfind(b"\n", 0, cut)
+            parts.append(chunk[:cut])
+        line = b"".join(reversed(parts))
+        if line.strip():
+            yield 0, line_end, json.loads(line)
+
+
+def _last_entry() -> Tuple[Optional[Dict[str, Any]], int]:
+    """Return the final history entry and the byte offset its line starts at."""
+    with closing(_history_reversed(HISTORY_FILE)) as entries:
+        for start, _end, entry in entries:
+            return entry, start
+    return None, 0
+
+
+def _truncate_history(offset: int) -> None:
+    """Drop every history line starting at byte *offset*."""
+    with HISTORY_FILE.open("r+b") as fp:
+        fp.truncate(offset)
 
 
 def _record_action(action: Action) -> None:
-    entries = _load_history()
-    entries.append(asdict(action))
-    _save_history(entries)
+    with HISTORY_FILE.open("a", encoding="utf-8") as fp:
+        fp.write(_dumps(asdict(action)) + "\n")
 
 
 def revert_last_change(dry_run: bool = False) -> None:
@@ -87,18 +148,23 @@ def revert_last_change(dry_run: bool = False) -> None:
     RuntimeError
         If there is no history to revert.
     """
-    entries = _load_history()
-    if not entries:
+    last, offset = _last_entry()
+    if last is None:
         raise RuntimeError("No actions to revert.")
-    last = Action(**entries.pop())
-    inverse = last.inverse()
+    inverse = Action(**last).inverse()
 
     # Perform inverse operation
-    _dispatch(inverse, dry_run=dry_run)
+    if _OS == 1:
+        # Linux logs exactly which folders it renamed: undo those and nothing
+        # else (none at all if the original action found nothing to rename)
+        for src, dst in inverse.renames:
+            _rename(src, dst, dry_run)
+    else:
+        _dispatch(inverse, dry_run=dry_run)
 
-    # Pop the reverted action off history only if it succeeded
+    # Drop the reverted action (and the inverse just logged) only if it succeeded
     if not dry_run:
-        _save_history(entries)
+        _truncate_history(offset)
 
 
 # --------------------------------------------------------------------------- #
@@ -120,33 +186,18 @@ def is_hidden(path: str | Path) -> bool:
     """
     Best-effort hidden check (not 100 % fool-proof, but fast).
 
-    • macOS   – checks chflags output for 'hidden'
+    • macOS   – UF_HIDDEN bit in st_flags
     • Linux   – leading '.' in name
-    • Windows – attrib output contains 'H'
+    • Windows – FILE_ATTRIBUTE_HIDDEN via GetFileAttributesW
+
+    All checks are plain syscalls – no `ls` / `attrib` subprocess.
     """
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(path)
-
-    if SYSTEM == "Darwin":
-        result = subprocess.run(
-            ["ls", "-ldO", str(p)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return "hidden" in result.stdout.split()
-    elif SYSTEM == "Linux":
-        return p.name.startswith(".")
-    elif SYSTEM == "Windows":
-        result = subprocess.run(
-            ["attrib", str(p)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return " H " in result.stdout or result.stdout.rstrip().endswith("H")
-    return False  # Fallback
+    if _OS < 0:
+        return False  # Fallback
+    return _HIDDEN_CHECKS[_OS](p)
 
 
 # --------------------------------------------------------------------------- #
@@ -155,15 +206,16 @@ def is_hidden(path: str | Path) -> bool:
 
 
 def _dispatch(action: Action, dry_run: bool = False) -> None:
-    if SYSTEM == "Darwin":
-        _macos(action, dry_run)
-    elif SYSTEM == "Linux":
-        _linux(action, dry_run)
-    elif SYSTEM == "Windows":
-        _windows(action, dry_run)
-    else:
+    if _OS < 0:
         raise NotImplementedError(f"Unsupported OS: {SYSTEM}")
+    try:
+        _BACKENDS[_OS](action, dry_run)
+    except Exception:
+        if action.renames and not dry_run:
+            _record_action(action)  # a partial rename stays revertible
+        raise
 
+    # One append per action, however many folders it touched
     if not dry_run:
         _record_action(action)
 
@@ -174,12 +226,28 @@ def _dispatch(action: Action, dry_run: bool = False) -> None:
 
 
 def _macos(action: Action, dry_run: bool) -> None:
-    flag = "hidden" if action.op == "hide" else "nohidden"
-    cmd = ["chflags"]
+    """
+    Toggle UF_HIDDEN in-process – the same flag `chflags [-R] hidden` sets,
+    minus the fork/exec. Like `chflags -R`, recursion covers files and
+    folders and never follows symlinks.
+    """
+    hidden = action.op == "hide"
+    if dry_run:
+        flag = "hidden" if hidden else "nohidden"
+        _run(["chflags", *(["-R"] if action.recursive else []), flag, action.path], dry_run)
+        return
+
+    _macos_set_hidden(action.path, hidden)
     if action.recursive:
-        cmd.append("-R")
-    cmd.extend([flag, action.path])
-    _run(cmd, dry_run)
+        for dirpath, dirnames, filenames in os.walk(action.path):
+            for name in dirnames + filenames:
+                _macos_set_hidden(os.path.join(dirpath, name), hidden)
+
+
+def _macos_set_hidden(path: str, hidden: bool) -> None:
+    flags = os.lstat(path).st_flags
+    flags = flags | stat.UF_HIDDEN if hidden else flags & ~stat.UF_HIDDEN
+    os.chflags(path, flags, follow_symlinks=False)
 
 
 def _linux(action: Action, dry_run: bool) -> None:
@@ -188,39 +256,105 @@ def _linux(action: Action, dry_run: bool) -> None:
 
     Recursive rename is trickier; we *mirror* behaviour:
     • If recursive=True, operate on all sub-folders too.
+    • Sub-folders are renamed deepest-first so no rename ever invalidates
+      a path that is still waiting to be processed; the root goes last.
+
+    The concrete renames are stored on *action* so revert can undo every
+    one of them, not just the top-level folder.
     """
-    p = Path(action.path)
-    if not p.exists():
+    # Absolute once, so every rename below (and the history) is cwd-independent
+    top = os.path.abspath(action.path)
+    if not os.path.exists(top):
         raise FileNotFoundError(action.path)
+    parent, name = os.path.split(top)
+    if not name:
+        raise ValueError(f"Cannot rename the filesystem root: {action.path}")
+    action.path = top
 
-    if action.op == "hide":
-        _linux_hide_path(p, dry_run)
-        if action.recursive:
-            for sub in _descend_dirs(p):
-                _linux_hide_path(sub, dry_run)
-    else:
-        _linux_seek_path(p, dry_run)
-        if action.recursive:
-            for sub in _descend_dirs(p):
-                _linux_seek_path(sub, dry_run)
+    hide = action.op == "hide"
+    if action.recursive:
+        # Filtered during the walk: only folders that actually need renaming
+        subs = _descend_dirs(top, hidden=not hide)
+        if dry_run:
+            for parent, name in subs:
+                _linux_rename(parent, name, hide, dry_run)
+        else:
+            _rename_tree(list(subs), hide, action.renames)
+
+    if (name[0] == ".") != hide:  # skip if already in the requested state
+        action.renames.append(_linux_rename(parent, name, hide, dry_run))
+
+
+def _linux_rename(parent: str, name: str, hide: bool, dry_run: bool) -> Tuple[str, str]:
+    """Add (hide) or drop (seek) the single leading dot of *parent*/*name*."""
+    target = "." + name if hide else name[1:]
+    src, dst = os.path.join(parent, name), os.path.join(parent, target)
+    _rename(src, dst, dry_run)
+    return src, dst
+
+
+def _rename_tree(subs: List[Tuple[str, str]], hide: bool, done: List[Tuple[str, str]]) -> None:
+    """
+    Rename every `(parent, name)` folder in *subs* (as yielded by `_descend_dirs`),
+    appending each completed `(src, dst)` to *done* – also when a later one fails.
 
+    Large trees are processed one depth level at a time, deepest first:
+    folders on the same level never contain each other, so the level is
+    fanned out to a thread pool. Siblings stay together in one task because
+    the kernel serialises renames inside a single parent directory anyway.
+    """
+    if len(subs) < _PARALLEL_MIN:
+        for parent, name in subs:
+            done.append(_linux_rename(parent, name, hide, False))
+        return
 
-def _linux_hide_path(path: Path, dry_run: bool) -> None:
-    if path.name.startswith("."):
-        return  # already hidden
-    target = path.with_name(f".{path.name}")
-    _run(["mv", str(path), str(target)], dry_run)
+    levels: Dict[int, Dict[str, List[str]]] = {}
+    for parent, name in subs:
+        levels.setdefault(parent.count(os.sep), {}).setdefault(parent, []).append(name)
 
+    def _rename_siblings(item: Tuple[str, List[str]]) -> None:
+        parent, names = item
+        for name in names:
+            done.append(_linux_rename(parent, name, hide, False))  # atomic under the GIL
 
-def _linux_seek_path(path: Path, dry_run: bool) -> None:
-    if not path.name.startswith("."):
-        return  # already visible
-    target = path.with_name(path.name.lstrip("."))
-    _run(["mv", str(path), str(target)], dry_run)
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # On error map() cancels queued tasks and the block waits for running
+        # ones, so *done* holds every rename that actually happened
+        for depth in sorted(levels, reverse=True):
+            list(pool.map(_rename_siblings, levels[depth].items()))
 
 
-def _descend_dirs(root: Path) -> List[Path]:
-    return [d for d, _, _ in os.walk(root)][1:]  # skip root itself
+def _descend_dirs(root: str, hidden: bool) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily yield `(parent, name)` of sub-folders below *root* whose hidden
+    state equals *hidden*, children before their parents.
+
+    Every folder is still descended into; the filter only decides what is
+    yielded. Uses `os.scandir` directly so the dirent type answers `is_dir`
+    without an extra `stat` per entry; only the current branch is held in
+    memory and paths stay plain strings.
+    """
+    top = os.fspath(root)
+    stack: List[Tuple[str, str, str, List[Tuple[str, str]]]] = [("", "", top, _subdirs(top))]
+    while stack:
+        parent, name, path, pending = stack[-1]
+        if pending:
+            child_path, child_name = pending.pop()
+            stack.append((path, child_name, child_path, _subdirs(child_path)))
+            continue
+        stack.pop()
+        if stack and (name[0] == ".") == hidden:  # never yield root itself
+            yield parent, name
+
+
+def _subdirs(path: str) -> List[Tuple[str, str]]:
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return []  # unreadable – not descended into, as os.walk skipped it
+    with it:
+        return [(e.path, e.name) for e in it if e.is_dir(follow_symlinks=False)]
 
 
 def _windows(action: Action, dry_run: bool) -> None:
@@ -232,6 +366,30 @@ def _windows(action: Action, dry_run: bool) -> None:
     _run(cmd, dry_run)
 
 
+def _macos_is_hidden(path: Path) -> bool:
+    return bool(os.stat(path).st_flags & stat.UF_HIDDEN)
+
+
+def _linux_is_hidden(path: Path) -> bool:
+    return path.name[:1] == "."
+
+
+def _windows_is_hidden(path: Path) -> bool:
+    import ctypes
+
+    attrs = ctypes.windll.kernel32.GetFileAttributesW(str(path))
+    return attrs != _INVALID_FILE_ATTRIBUTES and bool(attrs & _FILE_ATTRIBUTE_HIDDEN)
+
+
+# Indexed by _OS: Darwin, Linux, Windows
+_BACKENDS: Tuple[Callable[[Action, bool], None], ...] = (_macos, _linux, _windows)
+_HIDDEN_CHECKS: Tuple[Callable[[Path], bool], ...] = (
+    _macos_is_hidden,
+    _linux_is_hidden,
+    _windows_is_hidden,
+)
+
+
 # --------------------------------------------------------------------------- #
 # Utility
 # --------------------------------------------------------------------------- #
@@ -241,9 +399,19 @@ def _run(cmd: List[str], dry_run: bool) -> None:
     if dry_run:
         print("[DRY-RUN]", " ".join(cmd))
         return
+    import subprocess  # only Windows `attrib` still shells out
+
     subprocess.run(cmd, check=True)
 
 
+def _rename(src: str, dst: str, dry_run: bool) -> None:
+    """Same-directory rename done in-process – no `mv` fork per folder."""
+    if dry_run:
+        print("[DRY-RUN] mv", src, "→", dst)
+        return
+    os.rename(src, dst)
+
+
 # --------------------------------------------------------------------------- #
 # Self-test (optional)
 # --------------------------------------------------------------------------- #
@@ -14,26 +14,31 @@ Capabilities
 
 Implementation notes
 --------------------
-• History log appended to same ~/.hns_history.json used by fs.py
+• History log appended to same ~/.hns_history.jsonl used by fs.py
   Entries are tagged "sanitize" for clear separation.
 • “Date” sorting uses file’s **creation time** (Unix `st_ctime`)
   unless *keep_date_saved* is True, in which case it uses “saved”
   (modification) time.
-• Works on macOS, Linux, Windows with pathlib + shutil.
+• Works on macOS, Linux, Windows; per-file work uses plain `os` / `os.path`
+  strings, `Path` only at the public boundary.
 """
 
 from __future__ import annotations
 
-import json
+import errno
 import os
 import random
+import shutil
 import time
+from contextlib import closing
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-HISTORY_FILE = Path.home() / ".hns_history.json"
+from . import fs
+
+HISTORY_FILE = fs.HISTORY_FILE  # one log shared with hide/seek
 TODAY = datetime.now().strftime("%d%m%y")
 
 
@@ -42,7 +47,7 @@ TODAY = datetime.now().strftime("%d%m%y")
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(frozen=True)  # immutable, so one instance can be shared (menu presets)
 class SanitizerOptions:
     # Naming
     sani_name: bool = False  # rename to [NNN_DDMMYY]
@@ -69,7 +74,10 @@ class _HistoryEntry:
     timestamp: float
     op: str  # "sanitize"
     root: str
-    moves: List[_Move]
+    # Struct-of-arrays: srcs[i] was moved to dsts[i]. Half the JSON keys of a
+    # list of {"src", "dst"} objects, and both sides decode as flat arrays.
+    srcs: List[str]
+    dsts: List[str]
 
 
 # --------------------------------------------------------------------------- #
@@ -91,43 +99,53 @@ def sanitize(root: str | Path, opts: SanitizerOptions) -> None:
     path = Path(root).expanduser().resolve()
     if not path.exists():
         raise FileNotFoundError(path)
+    top = os.fspath(path)  # plain strings from here on – no Path churn per file
 
-    # Collect targets
-    files = _gather_files(path, opts.recursive)
-    if not files:
-        return  # nothing to do
-
-    moves: List[_Move] = []
-    for file in files:
-        dst = _target_path(file, path, opts)
-        if dst == file:
-            continue
-        moves.append(_Move(str(file), str(dst)))
+    # Collect targets – lazily, one directory listing at a time
+    files = _gather_files(top, opts.recursive)
+    target = _make_target(top, opts)
 
     # Execute (or preview)
-    for mv in moves:
-        _apply_move(Path(mv.src), Path(mv.dst), opts.dry_run)
+    srcs: List[str] = []
+    dsts: List[str] = []
+    if opts.dry_run:
+        # Nothing touches disk, so each move is previewed as soon as it is planned
+        for mv in _plan_moves(files, target):
+            _apply_move(mv.src, mv.dst, dry_run=True)
+    else:
+        # Plan everything first: sorted buckets live below *root*, so moving
+        # while the walk is still running could pick moved files up again
+        planned = list(_plan_moves(files, target))
+        dests = _Destinations()
+        for parent in {os.path.dirname(mv.dst) for mv in planned}:
+            dests.ensure(parent)  # one mkdir + listing per distinct folder
+        try:
+            for mv in planned:
+                dst = _apply_move(mv.src, mv.dst, dry_run=False, dests=dests)
+                srcs.append(mv.src)
+                dsts.append(dst)  # record where the file really went
+        finally:
+            # Log every finished move – also when a later one failed – so a
+            # partial run can still be reverted, and before cleanup can fail
+            if srcs:
+                _record_history(_HistoryEntry(time.time(), "sanitize", top, srcs, dsts))
 
     # Cleanup empties
     if opts.cleanup_empty:
-        _cleanup_empty_dirs(path, opts.dry_run)
-
-    # Record history
-    if not opts.dry_run and moves:
-        _record_history(_HistoryEntry(time.time(), "sanitize", str(path), moves))
+        _cleanup_empty_dirs(top, opts.dry_run)
 
 
 def revert_last_sanitize(dry_run: bool = False) -> None:
     """Undo the most recent sanitise action."""
-    entries = _load_history()
-    if not entries:
+    found = _last_sanitize_entry()
+    if found is None:
         raise RuntimeError("No history available.")
-    last_idx = max(i for i, e in enumerate(entries) if e["op"] == "sanitize")
-    entry = entries.pop(last_idx)
-    for mv in reversed(entry["moves"]):  # reverse order
-        _apply_move(Path(mv["dst"]), Path(mv["src"]), dry_run)
+    start, end, entry = found
+    dests = _Destinations()
+    for src, dst in zip(reversed(entry["srcs"]), reversed(entry["dsts"])):  # reverse order
+        _apply_move(dst, src, dry_run, dests)
     if not dry_run:
-        _save_history(entries)
+        _drop_history_line(start, end)
 
 
 # --------------------------------------------------------------------------- #
@@ -135,35 +153,74 @@ def revert_last_sanitize(dry_run: bool = False) -> None:
 # --------------------------------------------------------------------------- #
 
 
-def _gather_files(root: Path, recursive: bool) -> Sequence[Path]:
-    if recursive:
-        return [p for p in root.rglob("*") if p.is_file()]
-    return [p for p in root.iterdir() if p.is_file()]
+def _gather_files(root: str, recursive: bool) -> Iterator[os.DirEntry]:
+    """
+    Yield a `DirEntry` for every regular file below *root*, lazily.
+
+    `DirEntry.is_file` / `is_dir` answer from the dirent type, so no `stat`
+    is issued per entry; memory stays proportional to the walk depth.
+    The entry is passed on as-is so `DirEntry.stat()` – fetched only when
+    date sorting needs it, then cached – is the single stat per file.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # unreadable folder – skipped, as the old rglob walk did
+        with it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _plan_moves(
+    entries: Iterable[os.DirEntry], target: Callable[[os.DirEntry], str]
+) -> Iterator[_Move]:
+    for entry in entries:
+        dst = target(entry)
+        if dst != entry.path:
+            yield _Move(entry.path, dst)
+
+
+def _make_target(root: str, opts: SanitizerOptions) -> Callable[[os.DirEntry], str]:
+    """
+    Build the destination-path function for one run.
+
+    *opts* is read once here rather than per file, and sort folders are
+    memoised by (type, date) since most files in a batch share a handful.
+    """
+    by_type, by_date, sani_name = opts.sort_by_type, opts.sort_by_date, opts.sani_name
+    bases: Dict[Tuple[str, str], str] = {}
+    join, splitext = os.path.join, os.path.splitext
+    randrange = random.Random().randrange  # private instance, bound once
 
+    def target(entry: os.DirEntry) -> str:
+        """Compute destination path for the file behind *entry*."""
+        name = entry.name
+        suffix = splitext(name)[1].lower()
 
-def _target_path(file: Path, root: Path, opts: SanitizerOptions) -> Path:
-    """Compute destination path for *file* according to options."""
-    # Determine base folder (sorting)
-    base = root
-    if opts.sort_by_type:
-        base = base / file.suffix.lstrip(".").lower()
-    if opts.sort_by_date:
-        dt = _file_date(file, opts)
-        date_folder = dt.strftime("%Y-%m-%d")
-        base = base / date_folder if opts.sort_by_type else base / date_folder
+        # Determine base folder (sorting)
+        kind = suffix[1:] if by_type else ""
+        day = ""
+        if by_date:
+            day = _file_date(entry.stat(follow_symlinks=False), opts).strftime("%Y-%m-%d")
+        base = bases.get((kind, day))
+        if base is None:
+            base = bases[(kind, day)] = join(root, *filter(None, (kind, day)))
 
-    # Determine filename
-    if opts.sani_name:
-        rand = f"{random.randint(0, 999):03d}"
-        new_name = f"{rand}_{TODAY}{file.suffix.lower()}"
-    else:
-        new_name = file.name
+        # Determine filename
+        if sani_name:
+            name = f"{randrange(1000):03d}_{TODAY}{suffix}"
 
-    return base / new_name
+        return join(base, name)
 
+    return target
 
-def _file_date(file: Path, opts: SanitizerOptions) -> datetime:
-    stat = file.stat()
+
+def _file_date(stat: os.stat_result, opts: SanitizerOptions) -> datetime:
     if opts.keep_date_saved:
         ts = stat.st_mtime
     else:
@@ -171,35 +228,123 @@ def _file_date(file: Path, opts: SanitizerOptions) -> datetime:
     return datetime.fromtimestamp(ts)
 
 
-def _apply_move(src: Path, dst: Path, dry_run: bool) -> None:
+class _Destinations:
+    """
+    In-memory view of every destination folder touched by one run.
+
+    Each folder is created (if needed) and listed exactly once; collision
+    checks then run against that name set instead of probing the disk with
+    `exists()` per candidate, and the last suffix used per name is
+    remembered so a crowded bucket is not rescanned from `_1` every time.
+    """
+
+    def __init__(self) -> None:
+        self._names: Dict[str, Set[str]] = {}
+        self._next_suffix: Dict[Tuple[str, str], int] = {}
+
+    def ensure(self, folder: str) -> Set[str]:
+        names = self._names.get(folder)
+        if names is None:
+            os.makedirs(folder, exist_ok=True)
+            names = self._names[folder] = set(os.listdir(folder))
+        return names
+
+    def claim(self, path: str) -> str:
+        """Reserve a free name for *path*, appending _1, _2 … if needed."""
+        folder, candidate = os.path.split(path)
+        names = self.ensure(folder)
+        if candidate in names:
+            key = (folder, candidate)
+            stem, suffix = os.path.splitext(candidate)
+            counter = self._next_suffix.get(key, 1)
+            candidate = f"{stem}_{counter}{suffix}"
+            while candidate in names:
+                counter += 1
+                candidate = f"{stem}_{counter}{suffix}"
+            self._next_suffix[key] = counter + 1
+        names.add(candidate)
+        return os.path.join(folder, candidate)
+
+    def release(self, path: str) -> None:
+        """Forget *path* after its file was moved away."""
+        folder, name = os.path.split(path)
+        names = self._names.get(folder)
+        if names is not None:
+            names.discard(name)
+
+
+def _apply_move(src: str, dst: str, dry_run: bool, dests: Optional[_Destinations] = None) -> str:
+    """
+    Move *src* to a free name at *dst*; return the path actually used.
+
+    `os.link` + `os.unlink` is a rename that refuses to clobber: the link
+    fails with FileExistsError if something appeared at the claimed name
+    since the folder was listed, and we simply claim the next suffix. No
+    `exists()` probe is needed up front. *dests* is only consulted for real
+    moves; callers moving many files pass one shared instance.
+    """
     if dry_run:
         print("[DRY-RUN]", src, "→", dst)
-        return
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    dst = _unique_path(dst)
-    src.rename(dst)
-
-
-def _unique_path(path: Path) -> Path:
-    """Ensure *path* is unique, appending _1, _2 … if needed."""
-    counter = 1
-    candidate = path
-    while candidate.exists():
-        candidate = path.with_stem(f"{path.stem}_{counter}")
-        counter += 1
-    return candidate
-
-
-def _cleanup_empty_dirs(root: Path, dry_run: bool) -> None:
-    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
-        p = Path(dirpath)
-        if p == root:
-            continue
-        if not dirnames and not filenames:
-            if dry_run:
-                print("[DRY-RUN] rmdir", p)
-            else:
-                p.rmdir()
+        return dst
+    if dests is None:
+        dests = _Destinations()
+    while True:
+        target = dests.claim(dst)
+        try:
+            os.link(src, target)
+        except FileExistsError:
+            continue  # name taken behind our back – claim() moves on to the next suffix
+        except OSError:
+            # No hard links here (FAT, some network shares) or another device
+            shutil.move(src, target)
+        else:
+            try:
+                os.unlink(src)
+            except OSError:
+                # e.g. a read-only source folder: drop the new link so the
+                # file is not left in two places, then report the failure
+                os.unlink(target)
+                dests.release(target)
+                raise
+        dests.release(src)
+        return target
+
+
+def _cleanup_empty_dirs(root: str, dry_run: bool) -> None:
+    """Remove every folder below *root* that is (or becomes) empty; keep *root*."""
+    _prune_empty(root, dry_run)
+
+
+def _prune_empty(path: str, dry_run: bool) -> bool:
+    """
+    Bottom-up: prune empty sub-folders of *path*, then report whether *path*
+    itself is now empty. One `scandir` per folder, and a folder emptied by
+    removing its children is caught in the same pass. In a dry run folders
+    count as removed, so the preview lists everything that would go.
+    """
+    try:
+        with os.scandir(path) as it:
+            children = [(e.path, e.is_dir(follow_symlinks=False)) for e in it]
+    except OSError:
+        return False  # unreadable – treat as non-empty and leave it, as os.walk did
+    remaining = 0
+    for child, is_dir in children:
+        if not (is_dir and _prune_empty(child, dry_run) and _rmdir(child, dry_run)):
+            remaining += 1
+    return remaining == 0
+
+
+def _rmdir(path: str, dry_run: bool) -> bool:
+    if dry_run:
+        print("[DRY-RUN] rmdir", path)
+        return True
+    try:
+        os.rmdir(path)
+    except OSError as exc:
+        if exc.errno in (errno.ENOTEMPTY, errno.EEXIST):
+            return False  # something was written into it meanwhile – leave it
+        raise
+    return True
 
 
 # --------------------------------------------------------------------------- #
@@ -207,17 +352,24 @@ def _cleanup_empty_dirs(root: Path, dry_run: bool) -> None:
 # --------------------------------------------------------------------------- #
 
 
-def _load_history() -> List[Dict[str, Any]]:
-    if HISTORY_FILE.exists():
-        return json.loads(HISTORY_FILE.read_text())
-    return []
+def _last_sanitize_entry() -> Optional[Tuple[int, int, Dict[str, Any]]]:
+    with closing(fs._history_reversed(HISTORY_FILE)) as entries:
+        for start, end, entry in entries:
+            if entry["op"] == "sanitize":
+                return start, end, entry
+    return None
 
 
-def _save_history(entries: List[Dict[str, Any]]) -> None:
-    HISTORY_FILE.write_text(json.dumps(entries, indent=2))
+def _drop_history_line(start: int, end: int) -> None:
+    """Cut bytes [start, end) out of the log, shifting only what follows."""
+    with HISTORY_FILE.open("r+b") as fp:
+        fp.seek(end)
+        tail = fp.read()
+        fp.seek(start)
+        fp.write(tail)
+        fp.truncate()
 
 
 def _record_history(entry: _HistoryEntry) -> None:
-    entries = _load_history()
-    entries.append(asdict(entry))
-    _save_history(entries)
+    with HISTORY_FILE.open("a", encoding="utf-8") as fp:
+        fp.write(fs._dumps(asdict(entry)) + "\n")
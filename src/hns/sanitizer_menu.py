@@ -13,71 +13,104 @@ Interactive Rich menu for the File Sanitizer module.
 
 from __future__ import annotations
 
-import random
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from .sanitizer import SanitizerOptions, revert_last_sanitize, sanitize
 
-console = Console(highlight=False)
+# Rich is imported on first use, so loading this module stays cheap
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+console: Optional[Console] = None  # created by launch_sanitizer_menu()
+_ansi = False  # stdout is a terminal – set alongside `console`
 
 ON = "●"
 ARROW = "▶"
 SEP = "↔"
 LOCK = "🔒"
 
+# Cursor home + erase-below: the next frame overwrites the last one in place
+# instead of wiping and repainting the whole screen
+_HOME = "\x1b[H\x1b[0J"
+_frame: List[str] = []  # rows currently on screen; empty forces a full repaint
+
 
 # --------------------------------------------------------------------------- #
 # Small state wrapper
 # --------------------------------------------------------------------------- #
 
 
+# One bit per toggle; the whole session state is a single int
+# Meta – FileName
+FLAG_SANI_NAME = 1 << 0
+FLAG_FNAME_LOCK = 1 << 1
+# Meta – Date
+FLAG_DATE_SAVED = 1 << 2
+FLAG_DATE_CREATED = 1 << 3
+FLAG_DATE_LOCK = 1 << 4
+# Master toggle
+FLAG_COMPLETE_SANITIZE = 1 << 5
+FLAG_RECURSIVE = 1 << 6
+# SaniSort
+FLAG_SORT_FILETYPE = 1 << 7
+FLAG_SORT_DATE = 1 << 8
+FLAG_SORT_RECURSIVE = 1 << 9
+FLAG_CLEANUP = 1 << 10
+FLAG_SORT_LOCK = 1 << 11  # part of master menu
+
+# Bits each screen shows – its render cache is keyed on `S.bits & mask`
+_FNAME_MASK = FLAG_SANI_NAME | FLAG_FNAME_LOCK
+_DATE_MASK = FLAG_DATE_SAVED | FLAG_DATE_CREATED | FLAG_DATE_LOCK
+_META_MASK = _FNAME_MASK | _DATE_MASK | FLAG_COMPLETE_SANITIZE
+_SORT_MASK = FLAG_SORT_FILETYPE | FLAG_SORT_DATE | FLAG_SORT_LOCK
+_SANISORT_MASK = _SORT_MASK | FLAG_SORT_RECURSIVE | FLAG_CLEANUP
+_MASTER_MASK = (_META_MASK | _SANISORT_MASK | FLAG_RECURSIVE) & ~FLAG_SORT_LOCK
+
+# Each lock and the sub-options it forces off
+_LOCK_PROPAGATION = {
+    FLAG_FNAME_LOCK: FLAG_SANI_NAME,
+    FLAG_DATE_LOCK: FLAG_DATE_SAVED | FLAG_DATE_CREATED,
+    FLAG_SORT_LOCK: FLAG_SORT_FILETYPE | FLAG_SORT_DATE,
+}
+
+# CompleteSanitize ignores every other toggle; SanitizerOptions is frozen, so
+# one shared instance serves every run
+_STRICT_PRESET = SanitizerOptions(
+    sani_name=True,
+    sort_by_type=True,
+    sort_by_date=True,
+    recursive=True,
+    cleanup_empty=True,
+)
+
+
 class _State:
-    """Holds all toggleable flags for the interactive session."""
-
-    # Meta – FileName
-    sani_name: bool = False
-    fname_lock: bool = False
-    # Meta – Date
-    date_saved: bool = False
-    date_created: bool = False
-    date_lock: bool = False
-    # Master toggle
-    complete_sanitize: bool = False
-    recursive: bool = False
-
-    # SaniSort
-    sort_filetype: bool = False
-    sort_date: bool = False
-    sort_recursive: bool = False
-    cleanup: bool = False
-    sort_lock: bool = False  # part of master menu
+    """Holds all toggleable flags for the interactive session as FLAG_* bits."""
+
+    bits: int = 0
 
     def to_opts(self) -> SanitizerOptions:
         """Convert current flags to SanitizerOptions for the backend."""
-        if self.complete_sanitize:
-            # strict preset
-            return SanitizerOptions(
-                sani_name=True,
-                sort_by_type=True,
-                sort_by_date=True,
-                recursive=True,
-                cleanup_empty=True,
-            )
+        bits = self.bits
+        if bits & FLAG_COMPLETE_SANITIZE:
+            return _STRICT_PRESET
+        mask = ~0
+        for lock, flags in _LOCK_PROPAGATION.items():
+            if bits & lock:
+                mask &= ~flags
+        eff = bits & mask  # locked sub-options dropped in one AND
         return SanitizerOptions(
-            sani_name=bool(self.sani_name and not self.fname_lock),
-            sort_by_type=bool(self.sort_filetype and not self.sort_lock),
-            sort_by_date=bool(self.sort_date and not self.sort_lock),
-            recursive=bool(self.recursive or self.sort_recursive),
-            cleanup_empty=bool(self.cleanup),
-            keep_date_saved=self.date_saved and not self.date_lock,
-            keep_date_created=self.date_created and not self.date_lock,
+            sani_name=bool(eff & FLAG_SANI_NAME),
+            sort_by_type=bool(eff & FLAG_SORT_FILETYPE),
+            sort_by_date=bool(eff & FLAG_SORT_DATE),
+            recursive=bool(eff & (FLAG_RECURSIVE | FLAG_SORT_RECURSIVE)),
+            cleanup_empty=bool(eff & FLAG_CLEANUP),
+            keep_date_saved=bool(eff & FLAG_DATE_SAVED),
+            keep_date_created=bool(eff & FLAG_DATE_CREATED),
         )
 
 
@@ -89,16 +122,267 @@ S = _State()  # session-global
 # --------------------------------------------------------------------------- #
 
 
-def _box(flag: bool) -> str:
-    return f"[{ON}]" if flag else "[ ]"
+# Both box variants and all eight option icons, formatted once at import
+_BOX = ("[ ]", f"[{ON}]")
+_ICON = {
+    (has_sub, locked, active): (
+        f"[{LOCK}]" if locked else f"[{ARROW}]" if has_sub else _BOX[active]
+    )
+    for has_sub in (False, True)
+    for locked in (False, True)
+    for active in (False, True)
+}
+
+
+def _box(flag: int) -> str:
+    return _BOX[flag != 0]  # accepts a bool or a masked FLAG_* bit
 
 
 def _option_icon(has_sub: bool, locked: bool, active: bool) -> str:
-    if locked:
-        return f"[{LOCK}]"
-    if has_sub:
-        return f"[{ARROW}]"
-    return _box(active)
+    return _ICON[(has_sub, locked, active)]
+
+
+def _paint(text: str) -> None:
+    """
+    Draw a pre-rendered frame with one plain stdout write, rewriting only the
+    rows that differ from the frame already on screen and erasing below it.
+    """
+    out = sys.stdout
+    if not _ansi:
+        out.write(text)
+        return
+    lines = text.splitlines()
+    if _frame:
+        changed = [
+            f"\x1b[{row};1H{line}\x1b[K"
+            for row, line in enumerate(lines, 1)
+            if row > len(_frame) or _frame[row - 1] != line
+        ]
+        changed.append(f"\x1b[{len(lines) + 1};1H\x1b[0J")  # drop the old prompt
+        out.write("".join(changed))
+    else:
+        out.write(_HOME + text)
+    out.flush()
+    _frame[:] = lines
+
+
+def _getch() -> str:
+    """Read one key press without waiting for Enter (cbreak / msvcrt)."""
+    try:
+        import termios
+        import tty
+    except ImportError:  # Windows
+        import msvcrt
+
+        return msvcrt.getwch()
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def _ask() -> str:
+    """Read a one-key menu choice; Enter comes back as ""."""
+    sys.stdout.write("> ")
+    sys.stdout.flush()
+    if sys.stdin.isatty():
+        key = _getch()
+        if key in ("\x04", "\x1a"):  # Ctrl-D / Ctrl-Z
+            raise EOFError
+        sys.stdout.write(key.strip() + "\n")  # cbreak does not echo
+        return key.strip().lower()
+    line = sys.stdin.readline()  # piped input: whole lines as before
+    if not line:
+        raise EOFError  # as Prompt.ask would, instead of spinning on ""
+    return line.strip().lower()
+
+
+def _capture(*renderables: object) -> str:
+    """Render once through the console and keep the ANSI output."""
+    with console.capture() as cap:
+        console.print(*renderables, sep="\n")
+    return cap.get()
+
+
+# Header panel markup per screen (the main menu also carries an intro line)
+_HEADERS: Dict[str, str] = {
+    "main": "[bold cyan]File Sanitizer – MainMenu[/]",
+    "meta": "[bold green]MetaData – Options[/]",
+    "fname": "[bold]FileName Options[/]",
+    "date": "[bold]Date Options[/]",
+    "sanisort": "[bold yellow]SaniSort – Options[/]",
+    "sort": "[bold]Sort Options[/]",
+    "master": "[bold magenta]MasterMenu – Overview[/]",
+}
+_MAIN_INTRO = (
+    "Press [bold]Enter[/] to provide a folder path for sanitisation\nor select an option below."
+)
+
+
+@lru_cache(maxsize=None)
+def _title(screen: str) -> str:
+    """A screen's header Panel, laid out and rendered exactly once."""
+    from rich.panel import Panel
+
+    panel = Panel.fit(_HEADERS[screen])
+    return _capture(panel, _MAIN_INTRO) if screen == "main" else _capture(panel)
+
+
+@lru_cache(maxsize=None)
+def _table(screen: str) -> Table:
+    """Build a screen's two-column skeleton once; flag cells are set by _set_cell."""
+    from rich.table import Table
+
+    tbl = Table(show_header=False)
+    for row in _LAYOUTS[screen]:
+        tbl.add_row(*row)
+    return tbl
+
+
+def _set_cell(tbl: Table, row: int, text: str) -> None:
+    """Overwrite one cell of a menu's second column in place."""
+    tbl.columns[1]._cells[row] = text
+
+
+# Row layout per screen; each Table is built by _table() on first render
+_LAYOUTS: Dict[str, tuple] = {
+    "main": (
+        ("[1]", "Metadata Options"),
+        ("[2]", "SaniSort Options"),
+        ("[3]", "Master Options"),
+        ("[u]", "Undo last sanitise"),
+        ("[q]", "Quit"),
+    ),
+    "meta": (("[1]", ""), ("[2]", ""), ("[3]", ""), ("[q]", "Back")),
+    "fname": (("[1]", ""), ("[2]", ""), ("[q]", "Back")),
+    "date": (("[1]", ""), ("[2]", ""), ("[3]", ""), ("[q]", "Back")),
+    "sanisort": (("[1]", ""), ("[2]", ""), ("[3]", ""), ("[q]", "Back")),
+    "sort": (("[1]", ""), ("[2]", ""), ("[3]", ""), ("[q]", "Back")),
+    "master": (
+        ("MetaData Options", ""),
+        ("  FileName", ""),
+        ("  Date", ""),
+        ("  Recursive", ""),
+        ("  CompleteSanitize", ""),
+        ("", ""),  # spacer
+        ("SaniSort Options", ""),
+        ("  Sort", ""),
+        ("  Recursive", ""),
+        ("  Cleanup", ""),
+        ("[q]", "Back"),
+    ),
+}
+
+
+# Multi-flag row templates with SEP folded in, filled by %-formatting
+_FNAME_ROW = f"%sFileName: %sSaniName {SEP} %sLock"
+_DATE_ROW = f"%sDate: %sSaved {SEP} %sCreated {SEP} %sLock"
+_SORT_ROW = f"%sSort: %sFileType {SEP} %sDate"
+_FNAME_FLAGS = f"%sSaniName {SEP} %sLock"
+_DATE_FLAGS = f"%sSaved {SEP} %sCreated {SEP} %sLock"
+_SORT_FLAGS = f"%sFileType {SEP} %sDate"
+
+# Table renderers – Rich runs here only on a _SCREENS miss
+
+
+def _render_main(_bits: int) -> str:
+    return _capture(_table("main"))
+
+
+def _render_metadata(bits: int) -> str:
+    tbl = _table("meta")
+    sani_name, fname_lock = bool(bits & FLAG_SANI_NAME), bool(bits & FLAG_FNAME_LOCK)
+    date_saved, date_created = bool(bits & FLAG_DATE_SAVED), bool(bits & FLAG_DATE_CREATED)
+    date_lock = bool(bits & FLAG_DATE_LOCK)
+    fname_icon = _option_icon(True, fname_lock, sani_name)
+    _set_cell(tbl, 0, _FNAME_ROW % (fname_icon, _BOX[sani_name], _BOX[fname_lock]))
+    date_icon = _option_icon(True, date_lock, date_saved or date_created)
+    _set_cell(
+        tbl,
+        1,
+        _DATE_ROW % (date_icon, _BOX[date_saved], _BOX[date_created], _BOX[date_lock]),
+    )
+    _set_cell(tbl, 2, _box(bits & FLAG_COMPLETE_SANITIZE) + "CompleteSanitize")
+    return _capture(tbl)
+
+
+def _render_fname_sub(bits: int) -> str:
+    tbl = _table("fname")
+    _set_cell(tbl, 0, _box(bits & FLAG_SANI_NAME) + "SaniName")
+    _set_cell(tbl, 1, _box(bits & FLAG_FNAME_LOCK) + "Lock")
+    return _capture(tbl)
+
+
+def _render_date_sub(bits: int) -> str:
+    tbl = _table("date")
+    _set_cell(tbl, 0, _box(bits & FLAG_DATE_SAVED) + "Saved")
+    _set_cell(tbl, 1, _box(bits & FLAG_DATE_CREATED) + "Created")
+    _set_cell(tbl, 2, _box(bits & FLAG_DATE_LOCK) + "Lock")
+    return _capture(tbl)
+
+
+def _render_sanisort(bits: int) -> str:
+    tbl = _table("sanisort")
+    sort_filetype, sort_date = bool(bits & FLAG_SORT_FILETYPE), bool(bits & FLAG_SORT_DATE)
+    sort_icon = _option_icon(True, bool(bits & FLAG_SORT_LOCK), sort_filetype or sort_date)
+    _set_cell(tbl, 0, _SORT_ROW % (sort_icon, _BOX[sort_filetype], _BOX[sort_date]))
+    _set_cell(tbl, 1, _box(bits & FLAG_SORT_RECURSIVE) + "Recursive")
+    _set_cell(tbl, 2, _box(bits & FLAG_CLEANUP) + "Cleanup")
+    return _capture(tbl)
+
+
+def _render_sort_sub(bits: int) -> str:
+    tbl = _table("sort")
+    _set_cell(tbl, 0, _box(bits & FLAG_SORT_FILETYPE) + "FileType")
+    _set_cell(tbl, 1, _box(bits & FLAG_SORT_DATE) + "Date")
+    _set_cell(tbl, 2, _box(bits & FLAG_SORT_LOCK) + "Lock")
+    return _capture(tbl)
+
+
+def _render_master(bits: int) -> str:
+    tbl = _table("master")
+    _set_cell(tbl, 1, _FNAME_FLAGS % (_box(bits & FLAG_SANI_NAME), _box(bits & FLAG_FNAME_LOCK)))
+    _set_cell(
+        tbl,
+        2,
+        _DATE_FLAGS
+        % (
+            _box(bits & FLAG_DATE_SAVED),
+            _box(bits & FLAG_DATE_CREATED),
+            _box(bits & FLAG_DATE_LOCK),
+        ),
+    )
+    _set_cell(tbl, 3, _box(bits & FLAG_RECURSIVE))
+    _set_cell(tbl, 4, _box(bits & FLAG_COMPLETE_SANITIZE))
+    _set_cell(tbl, 7, _SORT_FLAGS % (_box(bits & FLAG_SORT_FILETYPE), _box(bits & FLAG_SORT_DATE)))
+    _set_cell(tbl, 8, _box(bits & FLAG_SORT_RECURSIVE))
+    _set_cell(tbl, 9, _box(bits & FLAG_CLEANUP))
+    return _capture(tbl)
+
+
+_RENDERERS: Dict[str, Callable[[int], str]] = {
+    "main": _render_main,
+    "meta": _render_metadata,
+    "fname": _render_fname_sub,
+    "date": _render_date_sub,
+    "sanisort": _render_sanisort,
+    "sort": _render_sort_sub,
+    "master": _render_master,
+}
+
+# Whole frames (header + table) as raw ANSI, keyed by screen and its masked
+# bits – one entry per flag combination the user actually visits.
+_SCREENS: Dict[Tuple[str, int], str] = {}
+
+
+def _screen(name: str, bits: int = 0) -> str:
+    frame = _SCREENS.get((name, bits))
+    if frame is None:  # first visit to this state – render once via Rich
+        frame = _SCREENS[name, bits] = _title(name) + _RENDERERS[name](bits)
+    return frame
 
 
 # --------------------------------------------------------------------------- #
@@ -108,33 +392,19 @@ def _option_icon(has_sub: bool, locked: bool, active: bool) -> str:
 
 def launch_sanitizer_menu() -> None:
     """Top-level File Sanitizer main menu loop."""
+    global console, _ansi
+    if console is None:
+        from rich.console import Console
+
+        console = Console(highlight=False)
+        _ansi = console.is_terminal
+        for screen in _HEADERS:  # every header Panel is built once, up front
+            _title(screen)
+    _frame.clear()  # the caller's screen is still showing
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold cyan]File Sanitizer – MainMenu[/]"))
-        console.print(
-            "Press [bold]Enter[/] to provide a folder path for sanitisation\n"
-            "or select an option below."
-        )
-        tbl = Table(show_header=False)
-        tbl.add_row("[1]", "Metadata Options")
-        tbl.add_row("[2]", "SaniSort Options")
-        tbl.add_row("[3]", "Master Options")
-        tbl.add_row("[u]", "Undo last sanitise")
-        tbl.add_row("[q]", "Quit")
-        console.print(tbl)
-
-        choice = Prompt.ask("> ").strip().lower()
-        if choice == "":
-            _run_sanitiser()
-        elif choice == "1":
-            _metadata_menu()
-        elif choice == "2":
-            _sanisort_menu()
-        elif choice == "3":
-            _master_menu()
-        elif choice == "u":
-            _undo()
-        elif choice == "q":
+        _paint(_screen("main"))
+        handler = _MAIN_HANDLERS.get(_ask())
+        if handler is not None and handler():
             break
 
 
@@ -145,175 +415,99 @@ def launch_sanitizer_menu() -> None:
 
 def _metadata_menu() -> None:
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold green]MetaData – Options[/]"))
-        tbl = Table(show_header=False)
-        # FileName row
-        fname_active = S.sani_name
-        fname_icon = _option_icon(True, S.fname_lock, fname_active)
-        tbl.add_row(
-            "[1]",
-            f"{fname_icon}FileName: {_box(S.sani_name)}SaniName {SEP} {_box(S.fname_lock)}Lock",
-        )
-        # Date row
-        date_any = S.date_saved or S.date_created
-        date_icon = _option_icon(True, S.date_lock, date_any)
-        tbl.add_row(
-            "[2]",
-            f"{date_icon}Date: {_box(S.date_saved)}Saved {SEP} "
-            f"{_box(S.date_created)}Created {SEP} {_box(S.date_lock)}Lock",
-        )
-        tbl.add_row("[3]", f"{_box(S.complete_sanitize)}CompleteSanitize")
-        tbl.add_row("[q]", "Back")
-        console.print(tbl)
-
-        choice = Prompt.ask("> ").strip().lower()
-        if choice == "1":
-            _toggle_fname_sub()
-        elif choice == "2":
-            _toggle_date_sub()
-        elif choice == "3":
-            S.complete_sanitize = not S.complete_sanitize
-        elif choice == "q":
+        _paint(_screen("meta", S.bits & _META_MASK))
+        handler = _META_HANDLERS.get(_ask())
+        if handler is not None and handler():
             break
 
 
 def _toggle_fname_sub() -> None:
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold]FileName Options[/]"))
-        tbl = Table(show_header=False)
-        tbl.add_row("[1]", f"{_box(S.sani_name)}SaniName")
-        tbl.add_row("[2]", f"{_box(S.fname_lock)}Lock")
-        tbl.add_row("[q]", "Back")
-        console.print(tbl)
-        choice = Prompt.ask("> ").strip().lower()
-        if choice == "1" and not S.fname_lock:
-            S.sani_name = not S.sani_name
-        elif choice == "2":
-            S.fname_lock = not S.fname_lock
-            if S.fname_lock:
-                S.sani_name = False
-        elif choice == "q":
+        _paint(_screen("fname", S.bits & _FNAME_MASK))
+        handler = _FNAME_HANDLERS.get(_ask())
+        if handler is not None and handler():
             break
 
 
 def _toggle_date_sub() -> None:
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold]Date Options[/]"))
-        tbl = Table(show_header=False)
-        tbl.add_row("[1]", f"{_box(S.date_saved)}Saved")
-        tbl.add_row("[2]", f"{_box(S.date_created)}Created")
-        tbl.add_row("[3]", f"{_box(S.date_lock)}Lock")
-        tbl.add_row("[q]", "Back")
-        console.print(tbl)
-        choice = Prompt.ask("> ").strip().lower()
-        if choice == "1" and not S.date_lock:
-            S.date_saved = not S.date_saved
-        elif choice == "2" and not S.date_lock:
-            S.date_created = not S.date_created
-        elif choice == "3":
-            S.date_lock = not S.date_lock
-            if S.date_lock:
-                S.date_saved = S.date_created = False
-        elif choice == "q":
+        _paint(_screen("date", S.bits & _DATE_MASK))
+        handler = _DATE_HANDLERS.get(_ask())
+        if handler is not None and handler():
             break
 
 
 def _sanisort_menu() -> None:
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold yellow]SaniSort – Options[/]"))
-        sort_any = S.sort_filetype or S.sort_date
-        sort_icon = _option_icon(True, S.sort_lock, sort_any)
-        tbl = Table(show_header=False)
-        tbl.add_row(
-            "[1]",
-            f"{sort_icon}Sort: {_box(S.sort_filetype)}FileType {SEP} " f"{_box(S.sort_date)}Date",
-        )
-        tbl.add_row("[2]", f"{_box(S.sort_recursive)}Recursive")
-        tbl.add_row("[3]", f"{_box(S.cleanup)}Cleanup")
-        tbl.add_row("[q]", "Back")
-        console.print(tbl)
-
-        choice = Prompt.ask("> ").strip().lower()
-        if choice == "1":
-            _toggle_sort_sub()
-        elif choice == "2":
-            S.sort_recursive = not S.sort_recursive
-        elif choice == "3":
-            S.cleanup = not S.cleanup
-        elif choice == "q":
+        _paint(_screen("sanisort", S.bits & _SANISORT_MASK))
+        handler = _SANISORT_HANDLERS.get(_ask())
+        if handler is not None and handler():
             break
 
 
 def _toggle_sort_sub() -> None:
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold]Sort Options[/]"))
-        tbl = Table(show_header=False)
-        tbl.add_row("[1]", f"{_box(S.sort_filetype)}FileType")
-        tbl.add_row("[2]", f"{_box(S.sort_date)}Date")
-        tbl.add_row("[3]", f"{_box(S.sort_lock)}Lock")
-        tbl.add_row("[q]", "Back")
-        console.print(tbl)
-        choice = Prompt.ask("> ").strip().lower()
-        if choice == "1" and not S.sort_lock:
-            S.sort_filetype = not S.sort_filetype
-        elif choice == "2" and not S.sort_lock:
-            S.sort_date = not S.sort_date
-        elif choice == "3":
-            S.sort_lock = not S.sort_lock
-            if S.sort_lock:
-                S.sort_filetype = S.sort_date = False
-        elif choice == "q":
+        _paint(_screen("sort", S.bits & _SORT_MASK))
+        handler = _SORT_HANDLERS.get(_ask())
+        if handler is not None and handler():
             break
 
 
 def _master_menu() -> None:
     """Read-only dashboard & a place for quick global toggles."""
     while True:
-        console.clear()
-        console.print(Panel.fit("[bold magenta]MasterMenu – Overview[/]"))
-
-        tbl = Table(show_header=False)
-        tbl.add_row("MetaData Options", "")
-        tbl.add_row(
-            "  FileName",
-            f"{_box(S.sani_name)}SaniName {SEP} {_box(S.fname_lock)}Lock",
-        )
-        tbl.add_row(
-            "  Date",
-            f"{_box(S.date_saved)}Saved {SEP} {_box(S.date_created)}Created "
-            f"{SEP} {_box(S.date_lock)}Lock",
-        )
-        tbl.add_row("  Recursive", _box(S.recursive))
-        tbl.add_row("  CompleteSanitize", _box(S.complete_sanitize))
-        tbl.add_row("", "")  # spacer
-        tbl.add_row("SaniSort Options", "")
-        tbl.add_row(
-            "  Sort",
-            f"{_box(S.sort_filetype)}FileType {SEP} {_box(S.sort_date)}Date",
-        )
-        tbl.add_row("  Recursive", _box(S.sort_recursive))
-        tbl.add_row("  Cleanup", _box(S.cleanup))
-        tbl.add_row("[q]", "Back")
-        console.print(tbl)
-        if Prompt.ask("> ").strip().lower() == "q":
+        _paint(_screen("master", S.bits & _MASTER_MASK))
+        handler = _MASTER_HANDLERS.get(_ask())
+        if handler is not None and handler():
             break
 
 
+# --------------------------------------------------------------------------- #
+# Key handlers – a truthy return leaves the current menu
+# --------------------------------------------------------------------------- #
+
+_Handler = Callable[[], Optional[bool]]
+
+
+def _back() -> bool:
+    return True
+
+
+def _flip(flag: int, unless: int = 0) -> _Handler:
+    """Handler toggling *flag*; ignored while any bit of *unless* is set."""
+
+    def handler() -> None:
+        if not S.bits & unless:
+            S.bits ^= flag
+
+    return handler
+
+
+def _lock(lock: int, clears: int) -> _Handler:
+    """Handler toggling *lock*; switching it on also clears *clears*."""
+    shift = lock.bit_length() - 1  # the lock's bit index, resolved once here
+
+    def handler() -> None:
+        bits = S.bits ^ lock
+        # -(bit) is all ones when locked, 0 otherwise – no branch on state
+        S.bits = bits & ~(-((bits >> shift) & 1) & clears)
+
+    return handler
+
+
 # --------------------------------------------------------------------------- #
 # Actions
 # --------------------------------------------------------------------------- #
 
 
 def _run_sanitiser() -> None:
+    from rich.prompt import Prompt
+
     folder = Prompt.ask("Folder path", default=str(Path.cwd())).strip()
     if not folder:
         return
     opts = S.to_opts()
+    _frame.clear()  # engine output scrolls the screen; repaint in full next time
     try:
         sanitize(folder, opts)
         console.print("[green]✔ Sanitisation completed.[/]")
@@ -323,9 +517,51 @@ def _run_sanitiser() -> None:
 
 
 def _undo() -> None:
+    _frame.clear()
     try:
         revert_last_sanitize()
         console.print("[green]✔ Reverted last sanitise.[/]")
     except Exception as exc:
         console.print(f"[red]Error:[/] {exc}")
     input("Press Enter to continue…")
+
+
+# Dispatch tables – defined last so every menu and action above exists
+_MAIN_HANDLERS: Dict[str, _Handler] = {
+    "": _run_sanitiser,
+    "1": _metadata_menu,
+    "2": _sanisort_menu,
+    "3": _master_menu,
+    "u": _undo,
+    "q": _back,
+}
+_META_HANDLERS: Dict[str, _Handler] = {
+    "1": _toggle_fname_sub,
+    "2": _toggle_date_sub,
+    "3": _flip(FLAG_COMPLETE_SANITIZE),
+    "q": _back,
+}
+_FNAME_HANDLERS: Dict[str, _Handler] = {
+    "1": _flip(FLAG_SANI_NAME, unless=FLAG_FNAME_LOCK),
+    "2": _lock(FLAG_FNAME_LOCK, clears=FLAG_SANI_NAME),
+    "q": _back,
+}
+_DATE_HANDLERS: Dict[str, _Handler] = {
+    "1": _flip(FLAG_DATE_SAVED, unless=FLAG_DATE_LOCK),
+    "2": _flip(FLAG_DATE_CREATED, unless=FLAG_DATE_LOCK),
+    "3": _lock(FLAG_DATE_LOCK, clears=FLAG_DATE_SAVED | FLAG_DATE_CREATED),
+    "q": _back,
+}
+_SANISORT_HANDLERS: Dict[str, _Handler] = {
+    "1": _toggle_sort_sub,
+    "2": _flip(FLAG_SORT_RECURSIVE),
+    "3": _flip(FLAG_CLEANUP),
+    "q": _back,
+}
+_SORT_HANDLERS: Dict[str, _Handler] = {
+    "1": _flip(FLAG_SORT_FILETYPE, unless=FLAG_SORT_LOCK),
+    "2": _flip(FLAG_SORT_DATE, unless=FLAG_SORT_LOCK),
+    "3": _lock(FLAG_SORT_LOCK, clears=FLAG_SORT_FILETYPE | FLAG_SORT_DATE),
+    "q": _back,
+}
+_MASTER_HANDLERS: Dict[str, _Handler] = {"q": _back}
@@ -0,0 +1,37 @@
+"""
+shared pytest fixtures for hns
+──────────────────────────────
+One isolated history log per test and a helper that makes a folder unreadable.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from hns import fs, sanitizer
+
+
+@pytest.fixture(autouse=True)
+def _isolated_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep every test's history log out of the real home directory."""
+    history = tmp_path / "history.jsonl"
+    for module in (fs, sanitizer):  # both append to the one shared log
+        monkeypatch.setattr(module, "HISTORY_FILE", history)
+    return history
+
+
+def block_scandir(monkeypatch: pytest.MonkeyPatch, module: ModuleType, path: Path) -> None:
+    """Make `module.os.scandir` fail on *path* as an unreadable folder would."""
+    blocked = str(path)
+    real_scandir = os.scandir
+
+    def _scandir(target: str = "."):
+        if os.fspath(target) == blocked:
+            raise PermissionError(13, "Permission denied", blocked)
+        return real_scandir(target)
+
+    monkeypatch.setattr(module.os, "scandir", _scandir)
@@ -7,23 +7,31 @@ dry-run flag leaves the filesystem untouched.
 
 from __future__ import annotations
 
+import json
+import os
 import platform
 from pathlib import Path
 
 import pytest
+from conftest import block_scandir
 
 from hns import fs
 
+_IS_LINUX = platform.system() == "Linux"  # resolved once per test session
+
+
+def _history(path: Path) -> list:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
 
 def _hidden_variant(path: Path) -> Path:
     """
     Return the pathname that *fs.hide()* would create on this OS.
     Only relevant for Linux (dot-prefix strategy).
     """
-    system = platform.system()
-    if system == "Linux":
-        return path.with_name(f".{path.name}")
-    return path
+    return path.with_name(f".{path.name}") if _IS_LINUX else path
 
 
 @pytest.mark.parametrize("recursive", (False, True))
@@ -37,15 +45,16 @@ def test_hide_seek_revert(tmp_path: Path, recursive: bool) -> None:
     fs.hide(root, recursive=recursive)
     root_hidden_path = _hidden_variant(root)
     assert fs.is_hidden(root_hidden_path)
+    sub_now = root_hidden_path / sub.name  # the child moved along with its parent
     if recursive:
-        assert fs.is_hidden(_hidden_variant(sub))
+        assert fs.is_hidden(_hidden_variant(sub_now))
     else:
         # sub should remain visible when recursion is off
-        assert not fs.is_hidden(sub)
+        assert not fs.is_hidden(sub_now)
 
     # 2. Seek (non-recursive for this step)
     fs.seek(root_hidden_path, recursive=False)
-    root_visible_path = root_hidden_path if platform.system() != "Linux" else root
+    root_visible_path = root_hidden_path if not _IS_LINUX else root
     assert not fs.is_hidden(root_visible_path)
 
     # 3. Undo
@@ -66,3 +75,131 @@ def test_dry_run_leaves_filesystem_untouched(tmp_path: Path) -> None:
     # On Linux the folder would *not* be renamed in dry-run mode
     assert path.exists()
     assert not fs.is_hidden(path)
+
+
+def test_history_is_append_only_jsonl(tmp_path: Path, _isolated_history: Path) -> None:
+    for i in range(3):
+        fs._record_action(fs.Action(float(i), str(tmp_path / f"d{i}"), "hide", False))
+
+    lines = _isolated_history.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["timestamp"] for line in lines] == [0.0, 1.0, 2.0]
+    assert [e["path"] for e in _history(_isolated_history)] == [
+        str(tmp_path / f"d{i}") for i in range(3)
+    ]
+
+
+def test_last_entry_reads_only_the_tail(
+    monkeypatch: pytest.MonkeyPatch, _isolated_history: Path
+) -> None:
+    monkeypatch.setattr(fs, "_TAIL_CHUNK", 16)  # force several backward reads
+    for i in range(50):
+        fs._record_action(fs.Action(float(i), f"/long/enough/path/{i}", "seek", True))
+
+    last, offset = fs._last_entry()
+    assert last is not None and last["path"] == "/long/enough/path/49"
+
+    fs._truncate_history(offset)
+    assert len(_history(_isolated_history)) == 49
+
+
+def test_history_reversed_handles_a_multi_megabyte_line(
+    monkeypatch: pytest.MonkeyPatch, _isolated_history: Path
+) -> None:
+    monkeypatch.setattr(fs, "_TAIL_CHUNK", 1024)  # thousands of reads inside one line
+    paths = [f"/some/fairly/long/path/file_{i}.txt" for i in range(50_000)]
+    lines = [
+        json.dumps({"op": "hide"}) + "\n",
+        json.dumps({"op": "sanitize", "srcs": paths, "dsts": paths}) + "\n",
+        json.dumps({"op": "seek"}) + "\n",
+    ]
+    _isolated_history.write_text("".join(lines), encoding="utf-8")
+    assert _isolated_history.stat().st_size > 3_000_000
+
+    bounds = [0, len(lines[0]), len(lines[0]) + len(lines[1]), len("".join(lines))]
+    entries = list(fs._history_reversed(_isolated_history))
+    assert [e["op"] for _, _, e in entries] == ["seek", "sanitize", "hide"]
+    assert [(start, end) for start, end, _ in entries] == [
+        (bounds[2], bounds[3]),
+        (bounds[1], bounds[2]),
+        (bounds[0], bounds[1]),
+    ]
+    assert entries[1][2]["srcs"] == paths
+
+
+def test_revert_recursive_hide_restores_every_folder(
+    tmp_path: Path, _isolated_history: Path
+) -> None:
+    root = tmp_path / "tree"
+    for sub in ("a/b", "c"):
+        (root / sub).mkdir(parents=True)
+
+    fs.hide(root, recursive=True)
+    fs.revert_last_change()
+
+    for sub in ("", "a", "a/b", "c"):
+        assert not fs.is_hidden(root / sub)
+    assert _history(_isolated_history) == []
+
+
+@pytest.mark.skipif(not _IS_LINUX, reason="dot-rename back-end only")
+def test_relative_path_renames_inside_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "demo" / "child").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+
+    fs.hide("demo", recursive=True)
+    assert (tmp_path / ".demo" / ".child").is_dir()
+
+    fs.revert_last_change()
+    assert (tmp_path / "demo" / "child").is_dir()
+
+
+@pytest.mark.skipif(not _IS_LINUX, reason="dot-rename back-end only")
+def test_recursive_hide_skips_unreadable_folders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "tree"
+    (root / "open" / "inner").mkdir(parents=True)
+    (root / "locked" / "inner").mkdir(parents=True)
+    block_scandir(monkeypatch, fs, root / "locked")
+    fs.hide(root, recursive=True)
+
+    hidden = tmp_path / ".tree"
+    assert (hidden / ".open" / ".inner").is_dir()
+    assert (hidden / ".locked" / "inner").is_dir()  # folder renamed, contents skipped
+
+
+@pytest.mark.skipif(not _IS_LINUX, reason="dot-rename back-end only")
+def test_revert_of_a_no_op_hide_renames_nothing(tmp_path: Path) -> None:
+    already = tmp_path / ".foo"
+    already.mkdir()
+
+    fs.hide(already)
+    fs.revert_last_change()
+    assert already.is_dir()
+    assert not (tmp_path / "foo").exists()
+
+
+@pytest.mark.skipif(not _IS_LINUX, reason="dot-rename back-end only")
+def test_partial_recursive_hide_is_recorded_and_revertible(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "big"
+    names = [f"p{i}/c{j}" for i in range(10) for j in range(7)]  # 70 ≥ _PARALLEL_MIN
+    for name in names:
+        (root / name).mkdir(parents=True)
+    real_rename = fs._rename
+
+    def _flaky(src: str, dst: str, dry_run: bool) -> None:
+        if src.endswith(os.path.join("p3", "c2")):
+            raise PermissionError(13, "Permission denied", src)
+        real_rename(src, dst, dry_run)
+
+    monkeypatch.setattr(fs, "_rename", _flaky)
+    with pytest.raises(PermissionError):
+        fs.hide(root, recursive=True)
+    monkeypatch.setattr(fs, "_rename", real_rename)
+
+    done = _history(fs.HISTORY_FILE)[-1]["renames"]  # whichever workers ran before the failure
+    assert done and all(os.path.basename(dst).startswith(".") for _, dst in done)
+    fs.revert_last_change()
+    assert all((root / name).is_dir() for name in names)
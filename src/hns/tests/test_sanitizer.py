@@ -0,0 +1,196 @@
+"""
+pytest suite for hns.sanitizer
+──────────────────────────────
+Covers sorting, dry-run previews and undo on throw-away trees.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from conftest import block_scandir
+
+from hns import fs, sanitizer
+from hns.sanitizer import SanitizerOptions
+
+
+def _make_tree(root: Path) -> None:
+    (root / "nested").mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (root / "b.PDF").write_text("b")
+    (root / "nested" / "c.txt").write_text("c")
+
+
+def test_sort_by_type_and_revert(tmp_path: Path) -> None:
+    root = tmp_path / "messy"
+    _make_tree(root)
+
+    sanitizer.sanitize(root, SanitizerOptions(sort_by_type=True, recursive=True))
+    assert sorted(p.name for p in (root / "txt").iterdir()) == ["a.txt", "c.txt"]
+    assert (root / "pdf" / "b.PDF").is_file()
+
+    sanitizer.revert_last_sanitize()
+    assert (root / "a.txt").is_file()
+    assert (root / "b.PDF").is_file()
+    assert (root / "nested" / "c.txt").is_file()
+
+
+def test_dry_run_leaves_tree_untouched(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    root = tmp_path / "messy"
+    _make_tree(root)
+
+    opts = SanitizerOptions(sani_name=True, sort_by_type=True, recursive=True, dry_run=True)
+    sanitizer.sanitize(root, opts)
+
+    assert capsys.readouterr().out.count("[DRY-RUN]") == 3
+    assert sorted(p.name for p in root.iterdir()) == ["a.txt", "b.PDF", "nested"]
+    assert not sanitizer.HISTORY_FILE.exists()
+
+
+def test_sort_by_saved_date(tmp_path: Path) -> None:
+    root = tmp_path / "dated"
+    root.mkdir()
+    old = root / "old.txt"
+    old.write_text("x")
+    os.utime(old, (0, 86_400 * 365))  # 1971-01-01
+
+    sanitizer.sanitize(root, SanitizerOptions(sort_by_date=True, keep_date_saved=True))
+    expected = datetime.fromtimestamp(86_400 * 365).strftime("%Y-%m-%d")
+    assert (root / expected / "old.txt").is_file()
+
+
+def test_name_collisions_get_suffixes_and_revert(tmp_path: Path) -> None:
+    root = tmp_path / "dupes"
+    for sub in ("x", "y", "z"):
+        (root / sub).mkdir(parents=True)
+        (root / sub / "same.txt").write_text(sub)
+
+    sanitizer.sanitize(root, SanitizerOptions(sort_by_type=True, recursive=True))
+    bucket = root / "txt"
+    assert sorted(p.name for p in bucket.iterdir()) == ["same.txt", "same_1.txt", "same_2.txt"]
+    assert sorted(p.read_text() for p in bucket.iterdir()) == ["x", "y", "z"]
+
+    sanitizer.revert_last_sanitize()
+    assert [(root / sub / "same.txt").read_text() for sub in ("x", "y", "z")] == ["x", "y", "z"]
+
+
+def test_move_never_clobbers_a_file_created_after_listing(tmp_path: Path) -> None:
+    src = tmp_path / "src.txt"
+    src.write_text("new")
+    bucket = tmp_path / "bucket"
+    dests = sanitizer._Destinations()
+    dests.ensure(str(bucket))
+    (bucket / "src.txt").write_text("old")  # appears after the folder was listed
+
+    dst = sanitizer._apply_move(str(src), str(bucket / "src.txt"), False, dests)
+    assert Path(dst).name == "src_1.txt"
+    assert (bucket / "src.txt").read_text() == "old"
+    assert Path(dst).read_text() == "new"
+    assert not src.exists()
+
+
+def test_failed_unlink_leaves_the_file_only_at_its_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src.txt"
+    src.write_text("a")
+    bucket = tmp_path / "bucket"
+    real_unlink = os.unlink
+
+    def _unlink(path: str, *args, **kwargs) -> None:
+        if os.fspath(path) == str(src):
+            raise PermissionError(13, "Permission denied", str(src))
+        real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(sanitizer.os, "unlink", _unlink)
+    with pytest.raises(PermissionError):
+        sanitizer._apply_move(str(src), str(bucket / "src.txt"), False)
+
+    assert src.read_text() == "a"
+    assert list(bucket.iterdir()) == []  # the hard link was taken back
+
+
+def test_cleanup_removes_folders_emptied_by_the_run(tmp_path: Path) -> None:
+    root = tmp_path / "deep"
+    (root / "a" / "b" / "c").mkdir(parents=True)
+    (root / "a" / "b" / "c" / "f.txt").write_text("f")
+    (root / "empty" / "er").mkdir(parents=True)
+
+    opts = SanitizerOptions(sort_by_type=True, recursive=True, cleanup_empty=True)
+    sanitizer.sanitize(root, opts)
+
+    assert [p.name for p in root.iterdir()] == ["txt"]
+    assert (root / "txt" / "f.txt").is_file()
+
+
+def test_revert_finds_last_sanitize_behind_other_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _isolated_history: Path
+) -> None:
+    monkeypatch.setattr(fs, "_TAIL_CHUNK", 8)  # force many backward reads
+    root = tmp_path / "mixed"
+    _make_tree(root)
+    sanitizer.sanitize(root, SanitizerOptions(sort_by_type=True))
+    with _isolated_history.open("a", encoding="utf-8") as fp:
+        fp.write('{"timestamp":1.0,"path":"/x","op":"hide","recursive":false}\n')
+
+    sanitizer.revert_last_sanitize()
+    assert (root / "a.txt").is_file() and (root / "b.PDF").is_file()
+    assert _isolated_history.read_text(encoding="utf-8").count("\n") == 1  # only the hide left
+    with pytest.raises(RuntimeError):
+        sanitizer.revert_last_sanitize()
+
+
+def test_cleanup_skips_unreadable_folders_and_keeps_history(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _isolated_history: Path
+) -> None:
+    root = tmp_path / "locked"
+    _make_tree(root)
+    (root / "private").mkdir()
+    block_scandir(monkeypatch, sanitizer, root / "private")
+    sanitizer.sanitize(root, SanitizerOptions(sort_by_type=True, cleanup_empty=True))
+
+    assert (root / "txt" / "a.txt").is_file()
+    assert (root / "private").is_dir()  # left alone, not an error
+    assert _isolated_history.exists()
+
+
+def test_recursive_gather_skips_unreadable_folders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "partly_locked"
+    _make_tree(root)
+    block_scandir(monkeypatch, sanitizer, root / "nested")
+    sanitizer.sanitize(root, SanitizerOptions(sort_by_type=True, recursive=True))
+
+    assert (root / "txt" / "a.txt").is_file()
+    assert (root / "nested" / "c.txt").is_file()  # unreadable branch left as-is
+
+
+def test_partial_run_is_recorded_and_revertible(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "half_done"
+    root.mkdir()
+    names = [f"f{i}.txt" for i in range(5)]
+    for name in names:
+        (root / name).write_text(name)
+    real_apply = sanitizer._apply_move
+    calls = []
+
+    def _flaky(src: str, dst: str, dry_run: bool, dests=None) -> str:
+        calls.append(src)
+        if len(calls) == 3:
+            raise PermissionError(13, "Permission denied", src)
+        return real_apply(src, dst, dry_run, dests)
+
+    monkeypatch.setattr(sanitizer, "_apply_move", _flaky)
+    with pytest.raises(PermissionError):
+        sanitizer.sanitize(root, SanitizerOptions(sort_by_type=True))
+    monkeypatch.setattr(sanitizer, "_apply_move", real_apply)
+    assert len(list((root / "txt").iterdir())) == 2  # two moves finished before the failure
+
+    sanitizer.revert_last_sanitize()
+    assert sorted(p.name for p in root.iterdir() if p.is_file()) == names
@@ -0,0 +1,95 @@
+"""
+pytest suite for hns.sanitizer_menu
+───────────────────────────────────
+Checks the FLAG_* state: lock masking in to_opts() and the key handlers.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from hns import sanitizer_menu as menu
+from hns.sanitizer import SanitizerOptions
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch: pytest.MonkeyPatch) -> menu._State:
+    """Give every test its own session state instead of the module global."""
+    state = menu._State()
+    monkeypatch.setattr(menu, "S", state)
+    return state
+
+
+def _expected(bits: int) -> SanitizerOptions:
+    """The option rules spelled out flag by flag, as the menu documents them."""
+
+    def on(flag: int) -> bool:
+        return bool(bits & flag)
+
+    if on(menu.FLAG_COMPLETE_SANITIZE):
+        return SanitizerOptions(
+            sani_name=True, sort_by_type=True, sort_by_date=True, recursive=True, cleanup_empty=True
+        )
+    return SanitizerOptions(
+        sani_name=on(menu.FLAG_SANI_NAME) and not on(menu.FLAG_FNAME_LOCK),
+        sort_by_type=on(menu.FLAG_SORT_FILETYPE) and not on(menu.FLAG_SORT_LOCK),
+        sort_by_date=on(menu.FLAG_SORT_DATE) and not on(menu.FLAG_SORT_LOCK),
+        recursive=on(menu.FLAG_RECURSIVE) or on(menu.FLAG_SORT_RECURSIVE),
+        cleanup_empty=on(menu.FLAG_CLEANUP),
+        keep_date_saved=on(menu.FLAG_DATE_SAVED) and not on(menu.FLAG_DATE_LOCK),
+        keep_date_created=on(menu.FLAG_DATE_CREATED) and not on(menu.FLAG_DATE_LOCK),
+    )
+
+
+def test_to_opts_matches_the_flag_rules_for_every_state(_fresh_state: menu._State) -> None:
+    for bits in range(menu.FLAG_SORT_LOCK << 1):  # all 4096 combinations
+        _fresh_state.bits = bits
+        assert _fresh_state.to_opts() == _expected(bits), bin(bits)
+
+
+def test_complete_sanitize_returns_the_shared_preset(_fresh_state: menu._State) -> None:
+    _fresh_state.bits = menu.FLAG_COMPLETE_SANITIZE | menu.FLAG_FNAME_LOCK
+    assert _fresh_state.to_opts() is menu._STRICT_PRESET
+
+
+@pytest.mark.parametrize(
+    "handlers, flips, lock, subs",
+    (
+        (menu._FNAME_HANDLERS, "1", menu.FLAG_FNAME_LOCK, menu.FLAG_SANI_NAME),
+        (
+            menu._DATE_HANDLERS,
+            "12",
+            menu.FLAG_DATE_LOCK,
+            menu.FLAG_DATE_SAVED | menu.FLAG_DATE_CREATED,
+        ),
+        (
+            menu._SORT_HANDLERS,
+            "12",
+            menu.FLAG_SORT_LOCK,
+            menu.FLAG_SORT_FILETYPE | menu.FLAG_SORT_DATE,
+        ),
+    ),
+)
+def test_lock_clears_sub_options_and_blocks_their_toggles(
+    _fresh_state: menu._State, handlers: dict, flips: str, lock: int, subs: int
+) -> None:
+    lock_key = str(len(flips) + 1)  # the lock sits right after the sub-options
+    for key in flips:
+        handlers[key]()
+    assert _fresh_state.bits == subs
+
+    handlers[lock_key]()  # lock on → sub-options forced off
+    assert _fresh_state.bits == lock
+    for key in flips:
+        handlers[key]()  # ignored while locked
+    assert _fresh_state.bits == lock
+
+    handlers[lock_key]()  # lock off → nothing comes back on by itself
+    assert _fresh_state.bits == 0
+
+
+def test_lock_leaves_unrelated_flags_alone(_fresh_state: menu._State) -> None:
+    other = menu.FLAG_RECURSIVE | menu.FLAG_CLEANUP | menu.FLAG_DATE_SAVED
+    _fresh_state.bits = other | menu.FLAG_SORT_DATE
+    menu._SORT_HANDLERS["3"]()
+    assert _fresh_state.bits == other | menu.FLAG_SORT_LOCK